@@ -2,26 +2,87 @@
 
 import click
 from pathlib import Path
-from nexus.core.config import Configuration
-from nexus.core.registry import ImplementationRegistry
-from nexus.core.selector import ToolSelector
-from nexus import __version__
+from typing import Any
+
+
+class LazyServices(dict):
+    """Context object that builds core services on first access.
+    
+    Keeps ``nexus.core`` out of the import path of commands that never
+    touch the configuration, registry or selector. The services named in
+    ``SERVICES`` are built on first lookup through ``obj[name]`` or
+    ``obj.get(name)`` and then stored, and ``name in obj`` is true for
+    them whether or not they have been built yet.
+    """
+    
+    SERVICES = ("config", "registry", "selector")
+    
+    def __missing__(self, key: str) -> Any:
+        """Build, store and return a service that was not created yet.
+        
+        Args:
+            key: Service name.
+            
+        Returns:
+            The service instance.
+            
+        Raises:
+            KeyError: key is not a known service.
+        """
+        if key == 'config':
+            from nexus.core.config import Configuration
+            value = Configuration()
+        elif key == 'registry':
+            from nexus.core.registry import get_default_registry
+            value = get_default_registry()
+        elif key == 'selector':
+            from nexus.core.selector import ToolSelector
+            value = ToolSelector(self['registry'])
+        else:
+            raise KeyError(key)
+        
+        self[key] = value
+        return value
+    
+    def __contains__(self, key: object) -> bool:
+        """Report stored values and services that can be built.
+        
+        Args:
+            key: Key to look up.
+            
+        Returns:
+            True if ``self[key]`` would succeed.
+        """
+        return key in self.SERVICES or super().__contains__(key)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a value, building the service on first access.
+        
+        Args:
+            key: Key or service name.
+            default: Value returned when key is unknown.
+            
+        Returns:
+            The stored value or service, or default.
+        """
+        try:
+            return self[key]
+        except KeyError:
+            return default
 
 
 @click.group()
 @click.pass_context
 def cli(ctx):
     """Claude Nexus - Your central connection point for development tools."""
-    ctx.ensure_object(dict)
-    ctx.obj['config'] = Configuration()
-    ctx.obj['registry'] = ImplementationRegistry()
-    ctx.obj['selector'] = ToolSelector(ctx.obj['registry'])
+    ctx.obj = LazyServices(ctx.obj or {})
 
 
 @cli.command()
 def version():
     """Show Claude Nexus version."""
-    click.echo(f"Claude Nexus v{__version__.__version__}")
+    from nexus.__version__ import __version__
+    click.echo(f"Claude Nexus v{__version__}")
 
 
 @cli.command()
@@ -30,7 +91,8 @@ def doctor(ctx):
     """Check Claude Nexus health and configuration."""
     from rich.console import Console
     from rich.table import Table
-    import subprocess
+    import shutil
+    from concurrent.futures import ThreadPoolExecutor
     
     console = Console()
     config = ctx.obj['config']
@@ -73,20 +135,15 @@ def doctor(ctx):
     table.add_column("Purpose", style="white")
     table.add_column("Status", style="green")
     
+    # Probes are independent PATH lookups, so run them concurrently
+    with ThreadPoolExecutor(max_workers=len(tools)) as executor:
+        found = dict(zip(tools, executor.map(shutil.which, tools)))
+    
     for tool, purpose in tools.items():
-        try:
-            result = subprocess.run(
-                ["which", tool],
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            if result.returncode == 0:
-                status = "✅ Available"
-            else:
-                status = "❌ Not found"
-        except Exception:
-            status = "❌ Error"
+        if found[tool]:
+            status = "✅ Available"
+        else:
+            status = "❌ Not found"
         
         table.add_row(tool, purpose, status)
     
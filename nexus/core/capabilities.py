@@ -1,29 +1,48 @@
 """Capability definitions for Claude Nexus."""
 
-from enum import Enum, auto
+import operator
+from enum import IntFlag
+from functools import reduce
+from typing import Iterable
 
 
-class Capability(Enum):
-    """Capabilities that implementations can provide."""
+class Capability(IntFlag):
+    """Capabilities that implementations can provide.
+    
+    Each capability is a single bit, so a set of capabilities can be folded
+    into one mask and compared with a bitwise AND.
+    """
     
     # Basic operations
-    BASIC_READ = auto()
-    BASIC_WRITE = auto()
+    BASIC_READ = 1 << 0
+    BASIC_WRITE = 1 << 1
     
     # Advanced operations
-    BULK_OPERATIONS = auto()
-    ADVANCED_SEARCH = auto()
-    CUSTOM_FIELDS = auto()
+    BULK_OPERATIONS = 1 << 2
+    ADVANCED_SEARCH = 1 << 3
+    CUSTOM_FIELDS = 1 << 4
     
     # Integration features
-    WEBHOOKS = auto()
-    WORKFLOW_AUTOMATION = auto()
-    REAL_TIME_UPDATES = auto()
+    WEBHOOKS = 1 << 5
+    WORKFLOW_AUTOMATION = 1 << 6
+    REAL_TIME_UPDATES = 1 << 7
     
     # API-specific
-    API_ACCESS = auto()
-    RATE_LIMITING = auto()
+    API_ACCESS = 1 << 8
+    RATE_LIMITING = 1 << 9
     
     # CLI-specific
-    CLI_AVAILABLE = auto()
-    INTERACTIVE_MODE = auto()
\ No newline at end of file
+    CLI_AVAILABLE = 1 << 10
+    INTERACTIVE_MODE = 1 << 11
+
+
+def capability_mask(capabilities: Iterable[Capability]) -> Capability:
+    """Fold capabilities into a single bitmask.
+    
+    Args:
+        capabilities: Capabilities to combine.
+        
+    Returns:
+        Capability mask with a bit set for each capability.
+    """
+    return reduce(operator.or_, capabilities, Capability(0))
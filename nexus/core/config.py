@@ -1,10 +1,133 @@
 """Configuration management for Claude Nexus."""
 
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Optional, Dict
+from types import MappingProxyType
+from typing import Any, Optional, Dict, List, Mapping, Tuple
+import configparser
+import copy
+import functools
+import json
+import re
 import yaml
 import subprocess
 import os
+import time
+
+from nexus.__version__ import __version__
+
+
+# Seconds a cached git remote lookup stays valid
+_REMOTE_CACHE_TTL = 5.0
+
+# Largest toolkit.yaml that Configuration.get_fast() scans instead of loading
+_SNIFF_BYTES = 16384
+
+# Hot keys that get_fast() can read without parsing YAML
+_FAST_KEYS = frozenset(["toolkit.code_host.type"])
+
+# Block mapping keys and plain-word values understood by _sniff_scalar()
+_SNIFF_KEY = re.compile(r"[A-Za-z_][\w-]*")
+_SNIFF_WORD = re.compile(r"[A-Za-z][\w-]*")
+_SNIFF_COMMENT = re.compile(r"(?:^|[ \t])#.*")
+
+# Characters that make a value more than a plain single-line scalar
+_SNIFF_INDICATORS = frozenset("'\"[]{}&*!|>%@`")
+
+# Plain scalars that YAML would not load as strings
+_NON_STRING_SCALARS = frozenset(
+    ["true", "false", "yes", "no", "on", "off", "null"]
+)
+
+
+class _FastLoader(getattr(yaml, "CSafeLoader", yaml.SafeLoader)):
+    """Safe YAML loader, backed by libyaml when PyYAML was built with it."""
+
+
+# Sentinels for memoized get() lookups
+_MISSING = object()
+_NOT_FOUND = object()
+
+
+def _remote_cache_path() -> Path:
+    """Return the location of the git remote lookup cache.
+    
+    Returns:
+        Path to remotes.json in the user's cache directory.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return Path(cache_home) / "claude-nexus" / "remotes.json"
+
+
+def _sniff_scalar(text: str, parts: Tuple[str, ...]) -> Optional[str]:
+    """Find a plain word value in block-style YAML without parsing it.
+    
+    Lines are scanned one at a time, tracking the chain of parent keys by
+    indentation. Only a strict subset of YAML is accepted: blank lines,
+    comments and ``key:`` / ``key: value`` pairs with plain single-line
+    values, consistently indented and without duplicate keys, which YAML
+    reads the same way. Anything else gives up so the caller can load the
+    file properly.
+    
+    Args:
+        text: Complete YAML document text.
+        parts: Key path to look for.
+        
+    Returns:
+        The value, or None if it was not found or could not be read safely.
+    """
+    # Each parent is (indent, key, indent of its children once known)
+    parents: List[List[Any]] = []
+    seen = set()
+    found = None
+    for line in text.splitlines():
+        stripped = line.lstrip(" ")
+        if not stripped or stripped.startswith("#"):
+            continue
+        indent = len(line) - len(stripped)
+        while parents and parents[-1][0] >= indent:
+            parents.pop()
+        if parents:
+            if parents[-1][2] is None:
+                parents[-1][2] = indent
+            elif parents[-1][2] != indent:
+                return None
+        elif indent:
+            return None
+        
+        key, colon, rest = stripped.partition(":")
+        if (
+            not colon
+            or rest[:1] not in ("", " ")
+            or not _SNIFF_KEY.fullmatch(key)
+            or key.lower() in _NON_STRING_SCALARS
+        ):
+            return None
+        path = tuple(parent[1] for parent in parents) + (key,)
+        if path in seen:
+            return None
+        seen.add(path)
+        
+        value = _SNIFF_COMMENT.sub("", rest).strip()
+        if not value:
+            parents.append([indent, key, None])
+            continue
+        if (
+            value[0] in _SNIFF_INDICATORS
+            or value[:2] in ("- ", "? ")
+            or value in ("-", "?")
+            or ": " in value
+            or value.endswith(":")
+        ):
+            return None
+        if path == parts:
+            found = value
+    
+    if found is None or found.lower() in _NON_STRING_SCALARS:
+        return None
+    return found if _SNIFF_WORD.fullmatch(found) else None
 
 
 class Configuration:
@@ -13,36 +136,156 @@ class Configuration:
     def __init__(self, search_path: Optional[Path] = None):
         """Initialize configuration.
         
+        Only the config file location is resolved here; the configuration
+        itself is loaded on first access.
+        
         Args:
             search_path: Starting path to search for config files.
                         Defaults to current working directory.
         """
         self.search_path = search_path or Path.cwd()
-        self.config_path = None
-        self._config = self._load_configuration()
+        # Resolved now so a later cwd change cannot affect the lazy load
+        self._search_dir = os.path.abspath(self.search_path)
+        self.config_path = self._find_config_file(Path(self._search_dir))
+        # Resolved get() lookups; the configuration never changes after load
+        self._lookups: Dict[str, Any] = {}
+    
+    @cached_property
+    def _config(self) -> Dict[str, Any]:
+        """Merged configuration, loaded on first access.
+        
+        The memoized load is shared by every instance for the same search
+        path, so each instance works on its own copy.
+        """
+        return copy.deepcopy(_cached_load(self._search_dir))
+    
+    @cached_property
+    def _config_view(self) -> Mapping[str, Any]:
+        """Read-only view of the merged configuration."""
+        return MappingProxyType(self._config)
+    
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget configurations loaded earlier in this process."""
+        _cached_load.cache_clear()
+        _memoized_find.cache_clear()
+        _memoized_parse.cache_clear()
     
-    def _find_config_file(self) -> Optional[Path]:
+    @staticmethod
+    def _find_config_file(search_path: Path) -> Optional[Path]:
         """Find toolkit.yaml in standard locations.
         
+        Args:
+            search_path: Directory to search for a project config.
+            
         Returns:
             Path to config file if found, None otherwise.
         """
-        search_paths = [
-            self.search_path / ".claude" / "toolkit.yaml",
-            Path.home() / ".claude" / "toolkit.yaml",
-        ]
-        
-        for path in search_paths:
-            if path.exists():
-                return path
-        return None
+        return _memoized_find(str(search_path), os.path.expanduser("~"))
     
-    def _auto_detect_repo(self) -> Dict[str, Any]:
+    @classmethod
+    def _auto_detect_repo(cls, search_path: Path) -> Dict[str, Any]:
         """Auto-detect repository type from git remote.
         
+        The origin URL is read straight from ``.git/config``. Only when that
+        is not possible (worktrees, submodules, no origin section) is git
+        asked, and that answer is cached on disk for a few seconds, keyed by
+        the modification time of the repository's git metadata.
+        
+        Args:
+            search_path: Directory inside the repository.
+            
         Returns:
             Dictionary with auto-detected configuration.
         """
+        git_path = cls._find_git_path(search_path)
+        
+        repo_type = None
+        stamp = None
+        if git_path is not None:
+            git_config = git_path / "config" if git_path.is_dir() else git_path
+            remote_url = cls._read_origin_url(git_config)
+            if remote_url is not None:
+                repo_type = cls._repo_type_from_url(remote_url)
+            else:
+                try:
+                    stamp = git_config.stat().st_mtime_ns
+                except OSError:
+                    pass
+        
+        repo_key = os.path.abspath(search_path)
+        if repo_type is None and stamp is not None:
+            repo_type = cls._read_remote_cache(repo_key, stamp)
+        
+        if repo_type is None:
+            repo_type = cls._detect_repo_type(search_path)
+            if stamp is not None:
+                cls._write_remote_cache(repo_key, stamp, repo_type)
+        
+        return {"toolkit": {"code_host": {"type": repo_type}}}
+    
+    @staticmethod
+    def _find_git_path(search_path: Path) -> Optional[Path]:
+        """Find the ``.git`` entry of the repository containing a path.
+        
+        Args:
+            search_path: Directory inside the repository.
+            
+        Returns:
+            Path to the ``.git`` directory or file, None if not in a repo.
+        """
+        directory = Path(os.path.abspath(search_path))
+        for candidate in (directory, *directory.parents):
+            git_path = candidate / ".git"
+            if git_path.exists():
+                return git_path
+        return None
+    
+    @staticmethod
+    def _read_origin_url(git_config: Path) -> Optional[str]:
+        """Read the origin remote URL from a git config file.
+        
+        Args:
+            git_config: Path to the repository's git config file.
+            
+        Returns:
+            Origin URL, or None if the file or section is unavailable.
+        """
+        parser = configparser.ConfigParser(strict=False, interpolation=None)
+        try:
+            parser.read(git_config)
+        except (configparser.Error, UnicodeDecodeError):
+            return None
+        return parser.get('remote "origin"', 'url', fallback=None)
+    
+    @staticmethod
+    def _repo_type_from_url(remote_url: str) -> str:
+        """Map a git remote URL to a code host type.
+        
+        Args:
+            remote_url: Git remote URL.
+            
+        Returns:
+            Code host type ("gitlab", "github" or "unknown").
+        """
+        remote_url = remote_url.strip().lower()
+        
+        if "gitlab" in remote_url:
+            return "gitlab"
+        elif "github" in remote_url:
+            return "github"
+        return "unknown"
+    
+    @classmethod
+    def _detect_repo_type(cls, search_path: Path) -> str:
+        """Detect the code host type by asking git for the origin URL.
+        
+        Args:
+            search_path: Directory inside the repository.
+            
+        Returns:
+            Code host type ("gitlab", "github" or "unknown").
+        """
         try:
             # Try to get git remote URL
             result = subprocess.run(
@@ -50,40 +293,96 @@ class Configuration:
                 capture_output=True,
                 text=True,
                 check=False,
-                cwd=self.search_path
+                cwd=search_path
             )
             
             if result.returncode == 0:
-                remote_url = result.stdout.strip().lower()
-                
-                if "gitlab" in remote_url:
-                    return {"toolkit": {"code_host": {"type": "gitlab"}}}
-                elif "github" in remote_url:
-                    return {"toolkit": {"code_host": {"type": "github"}}}
+                return cls._repo_type_from_url(result.stdout)
         except (subprocess.SubprocessError, FileNotFoundError):
             pass
         
-        return {"toolkit": {"code_host": {"type": "unknown"}}}
+        return "unknown"
     
-    def _load_configuration(self) -> Dict[str, Any]:
+    @staticmethod
+    def _read_remote_cache(repo_key: str, stamp: int) -> Optional[str]:
+        """Look up a cached code host type for a repository.
+        
+        Args:
+            repo_key: Absolute path of the repository.
+            stamp: Current modification time of its git config.
+            
+        Returns:
+            Cached code host type, or None if missing or stale.
+        """
+        try:
+            with open(_remote_cache_path(), 'r') as f:
+                entry = json.load(f)[repo_key]
+            if (
+                entry["mtime_ns"] == stamp
+                and time.time() - entry["cached_at"] < _REMOTE_CACHE_TTL
+            ):
+                return entry["type"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+    
+    @staticmethod
+    def _write_remote_cache(repo_key: str, stamp: int, repo_type: str) -> None:
+        """Store a detected code host type, dropping expired entries.
+        
+        Args:
+            repo_key: Absolute path of the repository.
+            stamp: Modification time of its git config.
+            repo_type: Detected code host type.
+        """
+        cache_path = _remote_cache_path()
+        now = time.time()
+        try:
+            with open(cache_path, 'r') as f:
+                entries = json.load(f)
+            entries = {
+                key: entry for key, entry in entries.items()
+                if now - entry["cached_at"] < _REMOTE_CACHE_TTL
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            entries = {}
+        
+        entries[repo_key] = {
+            "mtime_ns": stamp,
+            "type": repo_type,
+            "cached_at": now,
+        }
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+            with open(tmp_path, 'w') as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+    
+    @classmethod
+    def _load_configuration(cls, search_path: Path) -> Dict[str, Any]:
         """Load configuration from file or auto-detect.
         
+        Args:
+            search_path: Starting path to search for config files.
+            
         Returns:
             Merged configuration dictionary.
         """
         config = {}
         
         # First, get auto-detected configuration
-        auto_config = self._auto_detect_repo()
+        auto_config = cls._auto_detect_repo(search_path)
         
         # Then try to load from file
-        self.config_path = self._find_config_file()
-        if self.config_path:
+        config_path = cls._find_config_file(search_path)
+        if config_path:
             try:
-                with open(self.config_path, 'r') as f:
-                    file_config = yaml.safe_load(f) or {}
+                file_config = cls._read_config_file(config_path)
                 # File config overrides auto-detection
-                config = self._deep_merge(auto_config, file_config)
+                config = cls._deep_merge(auto_config, file_config)
             except (yaml.YAMLError, IOError) as e:
                 # If there's an error reading the file, fall back to auto-detection
                 print(f"Warning: Error reading config file: {e}")
@@ -93,9 +392,95 @@ class Configuration:
         
         return config
     
-    def _deep_merge(self, base: dict, override: dict) -> dict:
+    @staticmethod
+    def _read_config_file(path: Path) -> Dict[str, Any]:
+        """Read a config file, reusing an earlier parse of the same version.
+        
+        The memoized parse may be shared by several search paths, so the
+        caller gets its own copy.
+        
+        Args:
+            path: Path to the YAML config file.
+            
+        Returns:
+            Parsed configuration dictionary owned by the caller.
+        """
+        return copy.deepcopy(_memoized_parse(path, path.stat().st_mtime_ns))
+    
+    @classmethod
+    def _parse_config_file(cls, path: Path, mtime_ns: int) -> Dict[str, Any]:
+        """Parse a config file, using its JSON sidecar cache when fresh.
+        
+        The parsed YAML is cached in ``<name>.cache.json`` next to the file
+        and reused as long as the YAML file has not been modified since.
+        
+        Args:
+            path: Path to the YAML config file.
+            mtime_ns: Modification time of the YAML file.
+            
+        Returns:
+            Parsed configuration dictionary.
+        """
+        cache_path = path.with_suffix(path.suffix + ".cache.json")
+        
+        try:
+            with open(cache_path, 'r') as f:
+                cached = json.load(f)
+            if (
+                cached.get("version") == __version__
+                and cached.get("mtime_ns") == mtime_ns
+            ):
+                return cached["config"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+        
+        # One read, then parse from memory rather than the file stream
+        with open(path, 'rb') as f:
+            data = f.read()
+        file_config = yaml.load(data, Loader=_FastLoader) or {}
+        
+        cls._write_cache(cache_path, mtime_ns, file_config)
+        return file_config
+    
+    @staticmethod
+    def _write_cache(
+        cache_path: Path,
+        mtime_ns: int,
+        file_config: Dict[str, Any]
+    ) -> None:
+        """Atomically write the JSON sidecar cache for a config file.
+        
+        Configs that do not survive a JSON round trip unchanged (e.g. dates
+        or non-string keys) are not cached. Write errors are ignored.
+        
+        Args:
+            cache_path: Path of the sidecar cache file.
+            mtime_ns: Modification time of the YAML file.
+            file_config: Parsed configuration to cache.
+        """
+        try:
+            payload = json.dumps({
+                "version": __version__,
+                "mtime_ns": mtime_ns,
+                "config": file_config,
+            })
+            if json.loads(payload)["config"] != file_config:
+                return
+            tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+            with open(tmp_path, 'w') as f:
+                f.write(payload)
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError):
+            pass
+    
+    @staticmethod
+    def _deep_merge(base: dict, override: dict) -> dict:
         """Deep merge two dictionaries.
         
+        The base is copied once up front and merged into in place. Values
+        taken from the override are not copied, so the override must not be
+        shared with anything else that could modify it.
+        
         Args:
             base: Base dictionary.
             override: Dictionary with values to override.
@@ -103,13 +488,16 @@ class Configuration:
         Returns:
             Merged dictionary.
         """
-        result = base.copy()
+        result = copy.deepcopy(base)
+        stack = [(result, override)]
         
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._deep_merge(result[key], value)
-            else:
-                result[key] = value
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                if isinstance(value, dict) and isinstance(target.get(key), dict):
+                    stack.append((target[key], value))
+                else:
+                    target[key] = value
         
         return result
     
@@ -123,23 +511,128 @@ class Configuration:
         Returns:
             Configuration value or default.
         """
-        keys = key.split('.')
+        value = self._lookups.get(key, _MISSING)
+        if value is _MISSING:
+            value = self._lookups[key] = self._lookup(key)
+        
+        return default if value is _NOT_FOUND else value
+    
+    def get_fast(self, key: str, default: Any = None) -> Any:
+        """Get a hot configuration value, avoiding a full load if possible.
+        
+        For keys with a known layout, a small config file is scanned line
+        by line. The scan only answers when the file is simple enough for
+        its answer to match a full parse; otherwise, or when the
+        configuration is already loaded, this behaves exactly like
+        :meth:`get`.
+        
+        Args:
+            key: Configuration key using dot notation.
+            default: Default value if key not found.
+            
+        Returns:
+            Configuration value or default.
+        """
+        if key in _FAST_KEYS and self.config_path and "_config" not in vars(self):
+            try:
+                with open(self.config_path, 'rb') as f:
+                    data = f.read(_SNIFF_BYTES + 1)
+                text = data.decode("utf-8") if len(data) <= _SNIFF_BYTES else ""
+            except (OSError, UnicodeDecodeError):
+                text = ""
+            
+            value = _sniff_scalar(text, _split_key(key)) if text else None
+            if value is not None:
+                return value
+        
+        return self.get(key, default)
+    
+    def _lookup(self, key: str) -> Any:
+        """Resolve a dotted key against the loaded configuration.
+        
+        Args:
+            key: Configuration key using dot notation.
+            
+        Returns:
+            Configuration value, or _NOT_FOUND if it is missing or None.
+        """
         value = self._config
         
-        for k in keys:
+        for k in _split_key(key):
             if isinstance(value, dict):
                 value = value.get(k)
                 if value is None:
-                    return default
+                    return _NOT_FOUND
             else:
-                return default
+                return _NOT_FOUND
         
         return value
     
-    def get_all(self) -> Dict[str, Any]:
+    def get_all(self) -> Mapping[str, Any]:
         """Get all configuration.
         
+        The result is a read-only view of the loaded configuration; use
+        ``dict(config.get_all())`` when a mutable copy is needed.
+        
         Returns:
-            Complete configuration dictionary.
+            Read-only view of the complete configuration.
         """
-        return self._config.copy()
\ No newline at end of file
+        return self._config_view
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_load(search_path: str) -> Dict[str, Any]:
+    """Load configuration once per search path for the process lifetime.
+    
+    Args:
+        search_path: Absolute starting path to search for config files.
+        
+    Returns:
+        Merged configuration dictionary.
+    """
+    return Configuration._load_configuration(Path(search_path))
+
+
+@functools.lru_cache(maxsize=16)
+def _memoized_parse(path: Path, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a config file once per path and modification time.
+    
+    Args:
+        path: Path to the YAML config file.
+        mtime_ns: Modification time of the YAML file.
+        
+    Returns:
+        Parsed configuration dictionary.
+    """
+    return Configuration._parse_config_file(path, mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _memoized_find(search_path: str, home: str) -> Optional[Path]:
+    """Find toolkit.yaml in the project or home directory.
+    
+    Args:
+        search_path: Directory to search for a project config.
+        home: User home directory.
+        
+    Returns:
+        Path to config file if found, None otherwise.
+    """
+    for directory in (search_path, home):
+        path = os.path.join(directory, ".claude", "toolkit.yaml")
+        if os.path.isfile(path):
+            return Path(path)
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Split a dotted configuration key into its parts.
+    
+    Args:
+        key: Configuration key using dot notation.
+        
+    Returns:
+        Tuple of key parts.
+    """
+    return tuple(key.split('.'))
@@ -1,18 +1,29 @@
 """Output formatting utilities for Claude Nexus."""
 
 import json
-from typing import Any, Dict, List
-from rich.console import Console
-from rich.table import Table
-from rich.json import JSON
+import operator
+from functools import cached_property, lru_cache
+from typing import Any, Dict, List, Optional
+
+
+@lru_cache(maxsize=None)
+def _get_console():
+    """Return the process-wide rich console, importing rich on first use.
+    
+    Returns:
+        Shared rich Console instance.
+    """
+    from rich.console import Console
+    return Console()
 
 
 class OutputFormatter:
     """Formats output for different display modes."""
     
-    def __init__(self):
-        """Initialize formatter."""
-        self.console = Console()
+    @cached_property
+    def console(self):
+        """Shared rich console, created on first access."""
+        return _get_console()
     
     def format_json(self, data: Any) -> str:
         """Format data as JSON.
@@ -46,6 +57,8 @@ class OutputFormatter:
         if not columns:
             columns = list(data[0].keys())
         
+        from rich.table import Table
+        
         # Create table
         table = Table(title=title, show_header=True, header_style="bold magenta")
         
@@ -53,15 +66,17 @@ class OutputFormatter:
         for col in columns:
             table.add_column(col, style="cyan")
         
-        # Add rows
+        # Add rows, fetching all columns at once when a row has every key
+        getter = operator.itemgetter(*columns) if columns else None
+        column_set = set(columns)
         for item in data:
-            row = []
-            for col in columns:
-                value = item.get(col, "")
-                if value is None:
-                    value = ""
-                row.append(str(value))
-            table.add_row(*row)
+            if getter is not None and column_set <= item.keys():
+                values = getter(item)
+                if len(columns) == 1:
+                    values = (values,)
+            else:
+                values = [item.get(col, "") for col in columns]
+            table.add_row(*["" if value is None else str(value) for value in values])
         
         self.console.print(table)
     
@@ -87,6 +102,8 @@ class OutputFormatter:
         Args:
             data: Data to print.
         """
+        from rich.json import JSON
+        
         json_str = self.format_json(data)
         self.console.print(JSON(json_str))
     
@@ -1,23 +1,87 @@
 """Implementation registry for Claude Nexus."""
 
-from typing import Type, List, Dict, Any, Optional
-from dataclasses import dataclass
-from nexus.core.capabilities import Capability
+import bisect
+import itertools
+from typing import Type, List, Dict, Any, Optional, Iterable, Tuple
+from dataclasses import dataclass, field
+from nexus.core.capabilities import Capability, capability_mask
 
 
-@dataclass
+@dataclass(frozen=True)
 class Implementation:
-    """Represents a registered implementation."""
+    """Represents a registered implementation.
+    
+    Capabilities are stored as a de-duplicated tuple in declaration order,
+    alongside a bitmask used for capability matching. Records are frozen
+    because registries and their copies share them.
+    """
     
     interface: Type
     implementation: Type
-    capabilities: List[Capability]
+    capabilities: Tuple[Capability, ...]
     priority: int = 0
     name: str = ""
+    cap_mask: Capability = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if not self.name:
-            self.name = self.implementation.__name__
+            object.__setattr__(self, "name", self.implementation.__name__)
+        capabilities = tuple(dict.fromkeys(self.capabilities))
+        object.__setattr__(self, "capabilities", capabilities)
+        object.__setattr__(self, "cap_mask", capability_mask(capabilities))
+
+
+class _PriorityList:
+    """Implementations kept in descending priority order.
+    
+    Each entry has a ``(-priority, sequence)`` key in a parallel list, so
+    new entries can be placed with bisect and equal priorities keep their
+    registration order.
+    """
+    
+    def __init__(self):
+        """Initialize an empty list."""
+        self.keys: List[Tuple[int, int]] = []
+        self.items: List[Implementation] = []
+    
+    def insert(self, impl: Implementation, sequence: int) -> None:
+        """Insert an implementation at its priority position.
+        
+        Args:
+            impl: Implementation to insert.
+            sequence: Registration sequence number used to break ties.
+        """
+        key = (-impl.priority, sequence)
+        index = bisect.bisect_left(self.keys, key)
+        self.keys.insert(index, key)
+        self.items.insert(index, impl)
+    
+    def append(self, impl: Implementation, sequence: int) -> None:
+        """Append an implementation without keeping order; see :meth:`sort`.
+        
+        Args:
+            impl: Implementation to append.
+            sequence: Registration sequence number used to break ties.
+        """
+        self.keys.append((-impl.priority, sequence))
+        self.items.append(impl)
+    
+    def sort(self) -> None:
+        """Restore priority order after entries were appended."""
+        entries = sorted(zip(self.keys, self.items), key=lambda entry: entry[0])
+        self.keys = [key for key, _ in entries]
+        self.items = [impl for _, impl in entries]
+    
+    def copy(self) -> "_PriorityList":
+        """Return an independent copy of this list.
+        
+        Returns:
+            New _PriorityList with the same entries.
+        """
+        clone = _PriorityList()
+        clone.keys = list(self.keys)
+        clone.items = list(self.items)
+        return clone
 
 
 class ImplementationRegistry:
@@ -25,13 +89,17 @@ class ImplementationRegistry:
     
     def __init__(self):
         """Initialize the registry."""
-        self._implementations: Dict[Type, List[Implementation]] = {}
+        self._implementations: Dict[Type, _PriorityList] = {}
+        self._by_name: Dict[Type, Dict[str, Implementation]] = {}
+        self._by_cap: Dict[Type, Dict[Capability, _PriorityList]] = {}
+        self._filtered: Dict[Tuple[Type, Capability], List[Implementation]] = {}
+        self._sequence = itertools.count()
     
     def register(
         self,
         interface: Type,
         implementation: Type,
-        capabilities: List[Capability],
+        capabilities: Iterable[Capability],
         priority: int = 0,
         name: Optional[str] = None
     ) -> None:
@@ -40,28 +108,86 @@ class ImplementationRegistry:
         Args:
             interface: Interface protocol class.
             implementation: Implementation class.
-            capabilities: List of capabilities this implementation provides.
+            capabilities: Capabilities this implementation provides.
             priority: Priority for selection (higher = preferred).
             name: Optional name for the implementation.
         """
-        impl = Implementation(
+        self._add(Implementation(
             interface=interface,
             implementation=implementation,
             capabilities=capabilities,
             priority=priority,
             name=name or implementation.__name__
-        )
+        ))
+    
+    def register_many(self, entries: Iterable[Tuple[Any, ...]]) -> None:
+        """Register several implementations, sorting each list only once.
+        
+        Args:
+            entries: Tuples of ``register`` arguments, i.e.
+                ``(interface, implementation, capabilities[, priority[, name]])``.
+        """
+        # Build every record before touching the registry, so a bad entry
+        # leaves it unchanged
+        implementations = []
+        for entry in entries:
+            interface, implementation, capabilities, *rest = entry
+            priority = rest[0] if rest else 0
+            name = rest[1] if len(rest) > 1 else None
+            implementations.append(Implementation(
+                interface=interface,
+                implementation=implementation,
+                capabilities=capabilities,
+                priority=priority,
+                name=name or implementation.__name__
+            ))
+        
+        pending: Dict[int, _PriorityList] = {}
+        for impl in implementations:
+            self._add(impl, pending)
         
+        for priority_list in pending.values():
+            priority_list.sort()
+    
+    def _add(
+        self,
+        impl: Implementation,
+        pending: Optional[Dict[int, _PriorityList]] = None
+    ) -> None:
+        """Add an implementation to the priority lists and indexes.
+        
+        Args:
+            impl: Implementation to add.
+            pending: If given, the implementation is appended unsorted and
+                every touched list is collected here to be sorted later.
+        """
+        interface = impl.interface
+        self._filtered.clear()
         if interface not in self._implementations:
-            self._implementations[interface] = []
+            self._implementations[interface] = _PriorityList()
+            self._by_cap[interface] = {}
+        
+        # The full list plus one bucket per individual capability bit
+        by_cap = self._by_cap[interface]
+        targets = [self._implementations[interface]]
+        for cap in Capability:
+            if cap & impl.cap_mask:
+                targets.append(by_cap.setdefault(cap, _PriorityList()))
         
-        self._implementations[interface].append(impl)
+        sequence = next(self._sequence)
+        for implementations in targets:
+            if pending is None:
+                # Insert keeping priority order (highest first, stable for ties)
+                implementations.insert(impl, sequence)
+            else:
+                implementations.append(impl, sequence)
+                pending[id(implementations)] = implementations
         
-        # Sort by priority (highest first)
-        self._implementations[interface].sort(
-            key=lambda x: x.priority,
-            reverse=True
-        )
+        # Index by name, keeping the highest priority entry for duplicates
+        by_name = self._by_name.setdefault(interface, {})
+        existing = by_name.get(impl.name)
+        if existing is None or impl.priority > existing.priority:
+            by_name[impl.name] = impl
     
     def get_implementations(self, interface: Type) -> List[Implementation]:
         """Get all implementations for an interface.
@@ -72,7 +198,8 @@ class ImplementationRegistry:
         Returns:
             List of Implementation objects.
         """
-        return self._implementations.get(interface, [])
+        implementations = self._implementations.get(interface)
+        return list(implementations.items) if implementations else []
     
     def get_implementation_by_name(
         self,
@@ -88,37 +215,54 @@ class ImplementationRegistry:
         Returns:
             Implementation object if found, None otherwise.
         """
-        implementations = self.get_implementations(interface)
-        
-        for impl in implementations:
-            if impl.name == name:
-                return impl
-        
-        return None
+        return self._by_name.get(interface, {}).get(name)
     
     def get_implementations_with_capabilities(
         self,
         interface: Type,
-        required_capabilities: List[Capability]
+        required_capabilities: Iterable[Capability]
     ) -> List[Implementation]:
         """Get implementations that have all required capabilities.
         
         Args:
             interface: Interface protocol class.
-            required_capabilities: List of required capabilities.
+            required_capabilities: Required capabilities.
             
         Returns:
             List of Implementation objects that satisfy requirements.
         """
-        implementations = self.get_implementations(interface)
-        matching = []
+        required = capability_mask(required_capabilities)
+        if not required:
+            return self.get_implementations(interface)
         
-        for impl in implementations:
-            # Check if implementation has all required capabilities
-            if all(cap in impl.capabilities for cap in required_capabilities):
-                matching.append(impl)
+        # Results are memoized per query until the next registration
+        key = (interface, required)
+        matches = self._filtered.get(key)
+        if matches is None:
+            matches = self._filtered[key] = self._filter(interface, required)
+        return list(matches)
+    
+    def _filter(self, interface: Type, required: Capability) -> List[Implementation]:
+        """Scan for implementations whose capabilities include a mask.
         
-        return matching
+        Args:
+            interface: Interface protocol class.
+            required: Non-empty mask of required capabilities.
+            
+        Returns:
+            Matching Implementation objects in priority order.
+        """
+        # Only the rarest required capability's bucket needs scanning
+        by_cap = self._by_cap.get(interface, {})
+        buckets = [by_cap.get(cap) for cap in Capability if cap & required]
+        if not all(buckets):
+            return []
+        candidates = min(buckets, key=lambda bucket: len(bucket.items)).items
+        
+        return [
+            impl for impl in candidates
+            if (impl.cap_mask & required) == required
+        ]
     
     def list_interfaces(self) -> List[Type]:
         """List all registered interfaces.
@@ -128,6 +272,55 @@ class ImplementationRegistry:
         """
         return list(self._implementations.keys())
     
+    def copy(self) -> "ImplementationRegistry":
+        """Create an independent registry with the same registrations.
+        
+        Registrations added to or cleared from the copy do not affect this
+        registry. The frozen Implementation records themselves are shared.
+        
+        Returns:
+            New ImplementationRegistry.
+        """
+        clone = ImplementationRegistry()
+        clone._sequence = itertools.count(next(self._sequence))
+        clone._implementations = {
+            interface: implementations.copy()
+            for interface, implementations in self._implementations.items()
+        }
+        clone._by_name = {
+            interface: dict(by_name)
+            for interface, by_name in self._by_name.items()
+        }
+        clone._by_cap = {
+            interface: {cap: bucket.copy() for cap, bucket in by_cap.items()}
+            for interface, by_cap in self._by_cap.items()
+        }
+        return clone
+    
     def clear(self) -> None:
         """Clear all registrations."""
-        self._implementations.clear()
\ No newline at end of file
+        self._implementations.clear()
+        self._by_name.clear()
+        self._by_cap.clear()
+        self._filtered.clear()
+
+
+_default_registry: Optional[ImplementationRegistry] = None
+
+
+def get_default_registry() -> ImplementationRegistry:
+    """Get the process-wide registry, creating it on first use.
+    
+    Returns:
+        Shared ImplementationRegistry.
+    """
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = ImplementationRegistry()
+    return _default_registry
+
+
+def reset_default_registry() -> None:
+    """Discard the process-wide registry so the next call builds a new one."""
+    global _default_registry
+    _default_registry = None
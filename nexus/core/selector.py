@@ -2,7 +2,7 @@
 
 from typing import Type, List, Any, Optional, TypeVar
 from nexus.core.registry import ImplementationRegistry
-from nexus.core.capabilities import Capability
+from nexus.core.capabilities import Capability, capability_mask
 from nexus.core.exceptions import NoImplementationError, NoCapableImplementationError
 
 
@@ -46,7 +46,8 @@ class ToolSelector:
             if impl:
                 # Check if it has required capabilities
                 if required_capabilities:
-                    if not all(cap in impl.capabilities for cap in required_capabilities):
+                    required = capability_mask(required_capabilities)
+                    if (impl.cap_mask & required) != required:
                         raise NoCapableImplementationError(
                             f"Implementation '{preferred_name}' does not have required capabilities: "
                             f"{required_capabilities}"
@@ -110,5 +111,5 @@ class ToolSelector:
         """
         impl = self.registry.get_implementation_by_name(interface, tool_name)
         if impl:
-            return impl.capabilities
+            return list(impl.capabilities)
         return []
\ No newline at end of file
@@ -4,6 +4,29 @@ import re
 from typing import Optional
 
 
+# Common ticket patterns: PROJ-123, CH-456, etc.
+_TICKET_RE = re.compile(r'^[A-Z]+-\d+$')
+
+# Git branch name rules, any match makes the name invalid
+_BRANCH_INVALID_RE = re.compile(
+    r'^\.|\.$'  # Starting or ending with dot
+    r'|\.\.|\.lock$'  # Double dots or .lock ending
+    r'|^/|/$'  # Starting or ending with slash
+    r'|//|\s'  # Double slashes or spaces
+    r'|[\x00-\x1f\x7f~^:?*\[]'  # Control chars and special chars
+)
+
+# Semantic versioning pattern
+_VERSION_RE = re.compile(
+    r'^v?\d+\.\d+\.\d+(-[a-zA-Z0-9\-\.]+)?(\+[a-zA-Z0-9\-\.]+)?$'
+)
+
+_URL_RE = re.compile(r'^https?://[^\s/$.?#].[^\s]*$', re.IGNORECASE)
+
+_UNSAFE_PATH_CHARS_RE = re.compile(r'[^\w\s\-\./]')
+_REPEATED_SLASHES_RE = re.compile(r'/+')
+
+
 class InputValidator:
     """Validates user input."""
     
@@ -17,9 +40,7 @@ class InputValidator:
         Returns:
             True if valid, False otherwise.
         """
-        # Common patterns: PROJ-123, CH-456, etc.
-        pattern = r'^[A-Z]+-\d+$'
-        return bool(re.match(pattern, ticket_id))
+        return bool(_TICKET_RE.match(ticket_id))
     
     @staticmethod
     def validate_branch_name(branch_name: str) -> bool:
@@ -31,18 +52,8 @@ class InputValidator:
         Returns:
             True if valid, False otherwise.
         """
-        # Git branch name rules
-        invalid_patterns = [
-            r'^\.', r'\.$',  # Starting or ending with dot
-            r'\.\.', r'\.lock$',  # Double dots or .lock ending
-            r'^/', r'/$',  # Starting or ending with slash
-            r'//', r'\s',  # Double slashes or spaces
-            r'[\x00-\x1f\x7f~^:?*\[]',  # Control chars and special chars
-        ]
-        
-        for pattern in invalid_patterns:
-            if re.search(pattern, branch_name):
-                return False
+        if _BRANCH_INVALID_RE.search(branch_name):
+            return False
         
         return len(branch_name) > 0 and len(branch_name) <= 255
     
@@ -56,9 +67,7 @@ class InputValidator:
         Returns:
             True if valid, False otherwise.
         """
-        # Semantic versioning pattern
-        pattern = r'^v?\d+\.\d+\.\d+(-[a-zA-Z0-9\-\.]+)?(\+[a-zA-Z0-9\-\.]+)?$'
-        return bool(re.match(pattern, version))
+        return bool(_VERSION_RE.match(version))
     
     @staticmethod
     def sanitize_path(path: str) -> str:
@@ -71,9 +80,9 @@ class InputValidator:
             Sanitized path.
         """
         # Remove potentially dangerous characters
-        sanitized = re.sub(r'[^\w\s\-\./]', '', path)
+        sanitized = _UNSAFE_PATH_CHARS_RE.sub('', path)
         # Remove multiple slashes
-        sanitized = re.sub(r'/+', '/', sanitized)
+        sanitized = _REPEATED_SLASHES_RE.sub('/', sanitized)
         # Remove leading/trailing whitespace
         return sanitized.strip()
     
@@ -87,5 +96,4 @@ class InputValidator:
         Returns:
             True if valid, False otherwise.
         """
-        pattern = r'^https?://[^\s/$.?#].[^\s]*$'
-        return bool(re.match(pattern, url, re.IGNORECASE))
\ No newline at end of file
+        return bool(_URL_RE.match(url))
\ No newline at end of file
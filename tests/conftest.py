@@ -1,41 +1,17 @@
 """Pytest configuration and fixtures."""
 
+import sys
 import pytest
 from pathlib import Path
-import tempfile
-import shutil
-from typing import Generator
-from nexus.core.registry import ImplementationRegistry
-from nexus.core.capabilities import Capability
+from typing import TYPE_CHECKING, Generator
 
-
-@pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
-    """Create a temporary directory for testing.
-    
-    Yields:
-        Path to temporary directory.
-    """
-    temp_path = Path(tempfile.mkdtemp())
-    yield temp_path
-    shutil.rmtree(temp_path)
+if TYPE_CHECKING:
+    from nexus.core.registry import ImplementationRegistry
+    from nexus.core.selector import ToolSelector
+    from tests.fixtures.mock_implementations import MockRun
 
 
-@pytest.fixture
-def sample_config_file(temp_dir: Path) -> Path:
-    """Create a sample configuration file.
-    
-    Args:
-        temp_dir: Temporary directory fixture.
-        
-    Returns:
-        Path to configuration file.
-    """
-    config_dir = temp_dir / ".claude"
-    config_dir.mkdir()
-    config_file = config_dir / "toolkit.yaml"
-    
-    config_file.write_text("""
+_SAMPLE_YAML = b"""
 toolkit:
   code_host:
     type: gitlab
@@ -47,23 +23,94 @@ toolkit:
   release:
     versioning:
       scheme: semver
-""")
-    
-    return config_file
+"""
+
+
+def _clear_configuration_cache() -> None:
+    """Clear memoized configurations if the config module is loaded."""
+    config_module = sys.modules.get("nexus.core.config")
+    if config_module is not None:
+        config_module.Configuration.clear_cache()
+
+
+@pytest.fixture(autouse=True)
+def clear_configuration_cache() -> Generator[None, None, None]:
+    """Drop memoized configurations so each test loads its own."""
+    _clear_configuration_cache()
+    yield
+    _clear_configuration_cache()
 
 
 @pytest.fixture
-def empty_registry() -> ImplementationRegistry:
-    """Create an empty implementation registry.
+def mock_run(monkeypatch: pytest.MonkeyPatch) -> "MockRun":
+    """Replace subprocess.run as seen by the config module.
     
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+        
+    Returns:
+        MockRun recording the calls made.
+    """
+    from tests.fixtures.mock_implementations import MockRun
+    
+    run = MockRun()
+    monkeypatch.setattr("nexus.core.config.subprocess.run", run)
+    return run
+
+
+@pytest.fixture(scope="session")
+def sample_config_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a sample configuration file shared by the whole session.
+    
+    Args:
+        tmp_path_factory: Session temporary directory factory.
+        
     Returns:
-        Empty ImplementationRegistry.
+        Path to configuration file.
     """
-    return ImplementationRegistry()
+    from tests.fixtures.config_files import write_toolkit_yaml
+    
+    return write_toolkit_yaml(tmp_path_factory.mktemp("sample"), _SAMPLE_YAML)
 
 
 @pytest.fixture
-def populated_registry() -> ImplementationRegistry:
+def populated_registry(
+    _populated_registry_session: "ImplementationRegistry"
+) -> "ImplementationRegistry":
+    """Provide a per-test copy of the sample registry.
+    
+    Args:
+        _populated_registry_session: Registry built once per session.
+        
+    Returns:
+        ImplementationRegistry with test implementations.
+    """
+    return _populated_registry_session.copy()
+
+
+@pytest.fixture(scope="session")
+def tool_selector(
+    _populated_registry_session: "ImplementationRegistry"
+) -> "ToolSelector":
+    """Provide a selector over the sample registry, shared by the session.
+    
+    ToolSelector keeps no state besides its registry and only reads from
+    it, so one instance serves every test. Tests that modify the registry
+    should build their own selector from ``populated_registry``.
+    
+    Args:
+        _populated_registry_session: Registry built once per session.
+        
+    Returns:
+        ToolSelector using the sample implementations.
+    """
+    from nexus.core.selector import ToolSelector
+    
+    return ToolSelector(_populated_registry_session)
+
+
+@pytest.fixture(scope="session")
+def _populated_registry_session() -> "ImplementationRegistry":
     """Create a registry with sample implementations.
     
     Returns:
@@ -72,43 +119,42 @@ def populated_registry() -> ImplementationRegistry:
     from tests.fixtures.mock_implementations import (
         MockGitLabCLI,
         MockGitLabAPI,
-        MockJiraCLI,
-        MockCodeHost,
-        MockIssueTracker
+        MockJiraCLI
     )
+    from nexus.core.capabilities import Capability
     from nexus.core.interfaces import CodeHost, IssueTracker
+    from nexus.core.registry import ImplementationRegistry
     
     registry = ImplementationRegistry()
-    
-    # Register CodeHost implementations
-    registry.register(
-        CodeHost,
-        MockGitLabCLI,
-        [Capability.BASIC_READ, Capability.CLI_AVAILABLE],
-        priority=1,
-        name="gitlab-cli"
-    )
-    
-    registry.register(
-        CodeHost,
-        MockGitLabAPI,
-        [
-            Capability.BASIC_READ,
-            Capability.BASIC_WRITE,
-            Capability.ADVANCED_SEARCH,
-            Capability.API_ACCESS
-        ],
-        priority=2,
-        name="gitlab-api"
-    )
-    
-    # Register IssueTracker implementations
-    registry.register(
-        IssueTracker,
-        MockJiraCLI,
-        [Capability.BASIC_READ, Capability.BASIC_WRITE, Capability.CLI_AVAILABLE],
-        priority=1,
-        name="jira-cli"
-    )
+    registry.register_many([
+        # CodeHost implementations
+        (
+            CodeHost,
+            MockGitLabCLI,
+            [Capability.BASIC_READ, Capability.CLI_AVAILABLE],
+            1,
+            "gitlab-cli"
+        ),
+        (
+            CodeHost,
+            MockGitLabAPI,
+            [
+                Capability.BASIC_READ,
+                Capability.BASIC_WRITE,
+                Capability.ADVANCED_SEARCH,
+                Capability.API_ACCESS
+            ],
+            2,
+            "gitlab-api"
+        ),
+        # IssueTracker implementations
+        (
+            IssueTracker,
+            MockJiraCLI,
+            [Capability.BASIC_READ, Capability.BASIC_WRITE, Capability.CLI_AVAILABLE],
+            1,
+            "jira-cli"
+        ),
+    ])
     
     return registry
\ No newline at end of file
@@ -0,0 +1,20 @@
+"""Helpers for writing configuration files in tests."""
+
+from pathlib import Path
+
+
+def write_toolkit_yaml(root: Path, content: bytes) -> Path:
+    """Write ``.claude/toolkit.yaml`` below a directory.
+    
+    Args:
+        root: Directory that gets the ``.claude`` folder.
+        content: Encoded YAML content of the file.
+        
+    Returns:
+        Path to the written toolkit.yaml.
+    """
+    config_dir = root / ".claude"
+    config_dir.mkdir(parents=True, exist_ok=True)
+    config_file = config_dir / "toolkit.yaml"
+    config_file.write_bytes(content)
+    return config_file
@@ -1,69 +1,94 @@
 """Mock implementations for testing."""
 
-from typing import List, Dict, Any
+from types import MappingProxyType, SimpleNamespace
+from typing import List, Dict, Any, Mapping, Optional, Tuple
 from nexus.core.capabilities import Capability
 
 
+# Read-only payloads shared by every mock call
+_DISCUSSIONS = (
+    MappingProxyType({"id": "disc1", "body": "Test discussion", "resolved": False}),
+)
+_SEARCH_RESULTS = (
+    MappingProxyType({"id": "TEST-1", "title": "Found Issue 1"}),
+    MappingProxyType({"id": "TEST-2", "title": "Found Issue 2"}),
+)
+
+# Payloads that depend on the call arguments, built once per argument
+_merge_requests: Dict[int, Mapping[str, Any]] = {}
+_merge_request_lists: Dict[str, Tuple[Mapping[str, Any], ...]] = {}
+_issues: Dict[str, Mapping[str, Any]] = {}
+
+
 class MockCodeHost:
     """Mock CodeHost implementation."""
     
-    @property
-    def capabilities(self) -> List[Capability]:
-        return [Capability.BASIC_READ]
+    __slots__ = ()
+    capabilities: Tuple[Capability, ...] = (Capability.BASIC_READ,)
     
-    def get_merge_request(self, mr_id: int) -> Dict[str, Any]:
-        return {
-            "id": mr_id,
-            "title": f"Mock MR #{mr_id}",
-            "state": "opened"
-        }
+    def get_merge_request(self, mr_id: int) -> Mapping[str, Any]:
+        merge_request = _merge_requests.get(mr_id)
+        if merge_request is None:
+            merge_request = _merge_requests[mr_id] = MappingProxyType({
+                "id": mr_id,
+                "title": f"Mock MR #{mr_id}",
+                "state": "opened"
+            })
+        return merge_request
     
-    def list_merge_requests(self, state: str = "opened") -> List[Dict[str, Any]]:
-        return [
-            {"id": 1, "title": "Mock MR #1", "state": state},
-            {"id": 2, "title": "Mock MR #2", "state": state}
-        ]
+    def list_merge_requests(
+        self,
+        state: str = "opened"
+    ) -> Tuple[Mapping[str, Any], ...]:
+        merge_requests = _merge_request_lists.get(state)
+        if merge_requests is None:
+            merge_requests = _merge_request_lists[state] = (
+                MappingProxyType({"id": 1, "title": "Mock MR #1", "state": state}),
+                MappingProxyType({"id": 2, "title": "Mock MR #2", "state": state})
+            )
+        return merge_requests
     
-    def get_discussions(self, mr_id: int) -> List[Dict[str, Any]]:
-        return [
-            {"id": "disc1", "body": "Test discussion", "resolved": False}
-        ]
+    def get_discussions(self, mr_id: int) -> Tuple[Mapping[str, Any], ...]:
+        return _DISCUSSIONS
 
 
 class MockGitLabCLI(MockCodeHost):
     """Mock GitLab CLI implementation."""
     
-    @property
-    def capabilities(self) -> List[Capability]:
-        return [Capability.BASIC_READ, Capability.CLI_AVAILABLE]
+    __slots__ = ()
+    capabilities = (Capability.BASIC_READ, Capability.CLI_AVAILABLE)
 
 
 class MockGitLabAPI(MockCodeHost):
     """Mock GitLab API implementation."""
     
-    @property
-    def capabilities(self) -> List[Capability]:
-        return [
-            Capability.BASIC_READ,
-            Capability.BASIC_WRITE,
-            Capability.ADVANCED_SEARCH,
-            Capability.API_ACCESS
-        ]
+    __slots__ = ()
+    capabilities = (
+        Capability.BASIC_READ,
+        Capability.BASIC_WRITE,
+        Capability.ADVANCED_SEARCH,
+        Capability.API_ACCESS
+    )
 
 
 class MockIssueTracker:
     """Mock IssueTracker implementation."""
     
-    @property
-    def capabilities(self) -> List[Capability]:
-        return [Capability.BASIC_READ, Capability.BASIC_WRITE]
+    __slots__ = ()
+    capabilities: Tuple[Capability, ...] = (
+        Capability.BASIC_READ,
+        Capability.BASIC_WRITE
+    )
     
-    def get_issue(self, issue_id: str) -> Dict[str, Any]:
-        return {
-            "id": issue_id,
-            "title": f"Mock Issue {issue_id}",
-            "status": "Open"
-        }
+    def get_issue(self, issue_id: str) -> Mapping[str, Any]:
+        issue = _issues.get(issue_id)
+        if issue is None:
+            issue = _issues[issue_id] = MappingProxyType({
+                "id": issue_id,
+                "title": f"Mock Issue {issue_id}",
+                "status": "Open"
+            })
+        return issue
     
     def create_issue(self, title: str, description: str, **kwargs) -> str:
         return "TEST-123"
@@ -71,20 +96,32 @@ class MockIssueTracker:
     def update_issue(self, issue_id: str, **fields) -> None:
         pass
     
-    def search_issues(self, query: str) -> List[Dict[str, Any]]:
-        return [
-            {"id": "TEST-1", "title": "Found Issue 1"},
-            {"id": "TEST-2", "title": "Found Issue 2"}
-        ]
+    def search_issues(self, query: str) -> Tuple[Mapping[str, Any], ...]:
+        return _SEARCH_RESULTS
 
 
 class MockJiraCLI(MockIssueTracker):
     """Mock JIRA CLI implementation."""
     
-    @property
-    def capabilities(self) -> List[Capability]:
-        return [
-            Capability.BASIC_READ,
-            Capability.BASIC_WRITE,
-            Capability.CLI_AVAILABLE
-        ]
\ No newline at end of file
+    __slots__ = ()
+    capabilities = (
+        Capability.BASIC_READ,
+        Capability.BASIC_WRITE,
+        Capability.CLI_AVAILABLE
+    )
+
+
+class MockRun:
+    """Stand-in for subprocess.run that records calls."""
+    
+    def __init__(self):
+        self.returncode = 0
+        self.stdout = ""
+        self.error: Optional[Exception] = None
+        self.calls: List[tuple] = []
+    
+    def __call__(self, *args, **kwargs) -> SimpleNamespace:
+        self.calls.append(args)
+        if self.error is not None:
+            raise self.error
+        return SimpleNamespace(returncode=self.returncode, stdout=self.stdout)
@@ -0,0 +1,24 @@
+"""Tests for the CLI entry point."""
+
+from nexus.cli import LazyServices
+from nexus.core.registry import get_default_registry
+
+
+class TestLazyServices:
+    """Test LazyServices context object."""
+    
+    def test_get_builds_service(self):
+        """Test get() builds a service like item access does."""
+        services = LazyServices()
+        
+        assert "registry" in services
+        assert services.get("registry") is get_default_registry()
+        assert services["selector"].registry is services["registry"]
+    
+    def test_unknown_key(self):
+        """Test unknown keys behave like a normal dict."""
+        services = LazyServices({"verbose": True})
+        
+        assert "missing" not in services
+        assert services.get("missing", 1) == 1
+        assert services.get("verbose") is True
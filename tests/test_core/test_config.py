@@ -1,20 +1,28 @@
 """Tests for configuration management."""
 
+import json
+import os
 import pytest
+import yaml
+from collections.abc import Mapping
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from typing import Optional
+from nexus.core import config as config_module
 from nexus.core.config import Configuration
+from tests.fixtures.config_files import write_toolkit_yaml
+from tests.fixtures.mock_implementations import MockRun
+
+
+_YAML_BYTES_GITHUB = b"toolkit:\n  code_host:\n    type: github\n"
+_YAML_BYTES_GITLAB = b"toolkit:\n  code_host:\n    type: gitlab\n"
 
 
 class TestConfiguration:
     """Test Configuration class."""
     
-    def test_loads_from_yaml(self, temp_dir: Path):
+    def test_loads_from_yaml(self, tmp_path: Path):
         """Test configuration loads from toolkit.yaml."""
-        config_dir = temp_dir / ".claude"
-        config_dir.mkdir()
-        config_file = config_dir / "toolkit.yaml"
-        config_file.write_text("""
+        config_file = write_toolkit_yaml(tmp_path, b"""
 toolkit:
   code_host:
     type: gitlab
@@ -24,69 +32,57 @@ toolkit:
     project: TEST
 """)
         
-        config = Configuration(search_path=temp_dir)
+        config = Configuration(search_path=tmp_path)
         
         assert config.config_path == config_file
         assert config.get("toolkit.code_host.type") == "gitlab"
         assert config.get("toolkit.code_host.prefer") == "api"
         assert config.get("toolkit.issue_tracker.project") == "TEST"
     
-    def test_auto_detects_github(self, temp_dir: Path):
-        """Test auto-detection of GitHub from git remote."""
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout="https://github.com/user/repo.git"
-            )
-            
-            config = Configuration(search_path=temp_dir)
-            assert config.get("toolkit.code_host.type") == "github"
-    
-    def test_auto_detects_gitlab(self, temp_dir: Path):
-        """Test auto-detection of GitLab from git remote."""
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout="https://gitlab.com/user/repo.git"
-            )
-            
-            config = Configuration(search_path=temp_dir)
-            assert config.get("toolkit.code_host.type") == "gitlab"
-    
-    def test_file_overrides_auto_detection(self, temp_dir: Path):
+    @pytest.mark.parametrize(
+        "stdout,error,expected",
+        [
+            ("https://github.com/user/repo.git", None, "github"),
+            ("https://gitlab.com/user/repo.git", None, "gitlab"),
+            ("", FileNotFoundError(), "unknown"),
+        ],
+        ids=["github", "gitlab", "missing-git"]
+    )
+    def test_auto_detect(
+        self,
+        tmp_path: Path,
+        mock_run: MockRun,
+        stdout: str,
+        error: Optional[Exception],
+        expected: str
+    ):
+        """Test auto-detection of the code host from git remote."""
+        mock_run.stdout = stdout
+        mock_run.error = error
+        
+        config = Configuration(search_path=tmp_path)
+        assert config.get("toolkit.code_host.type") == expected
+    
+    def test_file_overrides_auto_detection(self, tmp_path: Path, mock_run: MockRun):
         """Test that file configuration overrides auto-detection."""
-        config_dir = temp_dir / ".claude"
-        config_dir.mkdir()
-        config_file = config_dir / "toolkit.yaml"
-        config_file.write_text("""
-toolkit:
-  code_host:
-    type: github
-""")
+        write_toolkit_yaml(tmp_path, _YAML_BYTES_GITHUB)
         
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout="https://gitlab.com/user/repo.git"
-            )
-            
-            config = Configuration(search_path=temp_dir)
-            # File config should override auto-detection
-            assert config.get("toolkit.code_host.type") == "github"
-    
-    def test_get_with_default(self, temp_dir: Path):
+        mock_run.stdout = "https://gitlab.com/user/repo.git"
+        
+        config = Configuration(search_path=tmp_path)
+        # File config should override auto-detection
+        assert config.get("toolkit.code_host.type") == "github"
+    
+    def test_get_with_default(self, tmp_path: Path):
         """Test getting config value with default."""
-        config = Configuration(search_path=temp_dir)
+        config = Configuration(search_path=tmp_path)
         
         assert config.get("nonexistent.key", "default") == "default"
         assert config.get("toolkit.missing.value", 42) == 42
     
-    def test_deep_merge(self, temp_dir: Path):
+    def test_deep_merge(self, tmp_path: Path, mock_run: MockRun):
         """Test deep merging of configuration."""
-        config_dir = temp_dir / ".claude"
-        config_dir.mkdir()
-        config_file = config_dir / "toolkit.yaml"
-        config_file.write_text("""
+        write_toolkit_yaml(tmp_path, b"""
 toolkit:
   code_host:
     prefer: api
@@ -94,52 +90,266 @@ toolkit:
     value: 123
 """)
         
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout="https://gitlab.com/user/repo.git"
-            )
-            
-            config = Configuration(search_path=temp_dir)
-            
-            # Auto-detected type should be present
-            assert config.get("toolkit.code_host.type") == "gitlab"
-            # File config should also be present
-            assert config.get("toolkit.code_host.prefer") == "api"
-            assert config.get("toolkit.custom.value") == 123
-    
-    def test_handles_missing_git(self, temp_dir: Path):
-        """Test handling when git is not available."""
-        with patch('subprocess.run') as mock_run:
-            mock_run.side_effect = FileNotFoundError()
-            
-            config = Configuration(search_path=temp_dir)
-            assert config.get("toolkit.code_host.type") == "unknown"
-    
-    def test_handles_invalid_yaml(self, temp_dir: Path):
+        mock_run.stdout = "https://gitlab.com/user/repo.git"
+        
+        config = Configuration(search_path=tmp_path)
+        
+        # Auto-detected type should be present
+        assert config.get("toolkit.code_host.type") == "gitlab"
+        # File config should also be present
+        assert config.get("toolkit.code_host.prefer") == "api"
+        assert config.get("toolkit.custom.value") == 123
+    
+    def test_handles_invalid_yaml(self, tmp_path: Path):
         """Test handling of invalid YAML file."""
-        config_dir = temp_dir / ".claude"
-        config_dir.mkdir()
-        config_file = config_dir / "toolkit.yaml"
-        config_file.write_text("invalid: yaml: content: :")
+        write_toolkit_yaml(tmp_path, b"invalid: yaml: content: :")
         
-        config = Configuration(search_path=temp_dir)
+        config = Configuration(search_path=tmp_path)
         # Should fall back to auto-detection
         assert config.get("toolkit.code_host.type") in ["github", "gitlab", "unknown"]
     
-    def test_get_all(self, temp_dir: Path):
+    def test_get_all(self, tmp_path: Path):
         """Test getting all configuration."""
-        config_dir = temp_dir / ".claude"
-        config_dir.mkdir()
-        config_file = config_dir / "toolkit.yaml"
-        config_file.write_text("""
+        write_toolkit_yaml(tmp_path, b"""
 toolkit:
   test: value
 """)
         
-        config = Configuration(search_path=temp_dir)
+        config = Configuration(search_path=tmp_path)
         all_config = config.get_all()
         
-        assert isinstance(all_config, dict)
+        assert isinstance(all_config, Mapping)
         assert "toolkit" in all_config
-        assert all_config["toolkit"]["test"] == "value"
\ No newline at end of file
+        assert all_config["toolkit"]["test"] == "value"
+        with pytest.raises(TypeError):
+            all_config["toolkit"] = {}
+    
+    def test_writes_json_cache(self, tmp_path: Path):
+        """Test parsed config is cached in a JSON sidecar file."""
+        config_file = write_toolkit_yaml(tmp_path, _YAML_BYTES_GITHUB)
+        
+        Configuration(search_path=tmp_path).get_all()
+        cache_file = config_file.with_name("toolkit.yaml.cache.json")
+        
+        assert cache_file.exists()
+        assert json.loads(cache_file.read_text())["config"] == {
+            "toolkit": {"code_host": {"type": "github"}}
+        }
+    
+    def test_json_cache_invalidated_on_change(self, tmp_path: Path):
+        """Test a modified config file is re-parsed instead of using the cache."""
+        config_file = write_toolkit_yaml(tmp_path, _YAML_BYTES_GITHUB)
+        Configuration(search_path=tmp_path).get_all()
+        
+        config_file.write_bytes(_YAML_BYTES_GITLAB)
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        Configuration.clear_cache()
+        
+        config = Configuration(search_path=tmp_path)
+        assert config.get("toolkit.code_host.type") == "gitlab"
+    
+    def test_memoizes_per_search_path(self, tmp_path: Path, mock_run: MockRun):
+        """Test configuration is loaded only once per search path."""
+        mock_run.stdout = "https://github.com/user/repo.git"
+        
+        first = Configuration(search_path=tmp_path).get_all()
+        second = Configuration(search_path=tmp_path).get_all()
+        
+        assert len(mock_run.calls) == 1
+        assert second == first
+    
+    def test_caches_git_remote_lookup(
+        self,
+        tmp_path: Path,
+        monkeypatch,
+        mock_run: MockRun
+    ):
+        """Test the git remote lookup is cached on disk per repository."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        repo_dir = tmp_path / "repo"
+        (repo_dir / ".git").mkdir(parents=True)
+        (repo_dir / ".git" / "config").write_bytes(b"[core]\n")
+        
+        mock_run.stdout = "https://gitlab.com/user/repo.git"
+        
+        Configuration(search_path=repo_dir).get_all()
+        Configuration.clear_cache()
+        config = Configuration(search_path=repo_dir)
+        
+        assert config.get("toolkit.code_host.type") == "gitlab"
+        assert len(mock_run.calls) == 1
+        assert (tmp_path / "cache" / "claude-nexus" / "remotes.json").exists()
+    
+    def test_reads_origin_from_git_config(self, tmp_path: Path, mock_run: MockRun):
+        """Test the origin URL is read from .git/config without running git."""
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "config").write_bytes(
+            b'[core]\n'
+            b'\tbare = false\n'
+            b'[remote "origin"]\n'
+            b'\turl = git@github.com:user/repo.git\n'
+            b'\tfetch = +refs/heads/*:refs/remotes/origin/*\n'
+        )
+        nested = tmp_path / "src" / "pkg"
+        nested.mkdir(parents=True)
+        
+        config = Configuration(search_path=nested)
+        
+        assert mock_run.calls == []
+        assert config.get("toolkit.code_host.type") == "github"
+    
+    def test_repeated_get_applies_each_default(self, tmp_path: Path):
+        """Test memoized lookups still honour the default of each call."""
+        config = Configuration(search_path=tmp_path)
+        
+        assert config.get("toolkit.missing.value", 1) == 1
+        assert config.get("toolkit.missing.value", 2) == 2
+        assert config.get("toolkit.missing.value") is None
+    
+    def test_get_fast_reads_file_head(self, tmp_path: Path, mock_run: MockRun):
+        """Test get_fast answers hot keys without loading the configuration."""
+        write_toolkit_yaml(tmp_path, b"""
+toolkit:
+  code_host:
+    prefer: api
+
+    type: github  # or gitlab
+  issue_tracker:
+    type: jira
+""")
+        
+        config = Configuration(search_path=tmp_path)
+        
+        assert config.get_fast("toolkit.code_host.type") == "github"
+        assert mock_run.calls == []
+    
+    def test_get_fast_falls_back_to_full_load(self, tmp_path: Path, mock_run: MockRun):
+        """Test get_fast falls back to get when the head does not match."""
+        write_toolkit_yaml(tmp_path, b"""
+toolkit:
+  code_host:
+    prefer: api
+  issue_tracker:
+    type: jira
+""")
+        
+        mock_run.stdout = "https://gitlab.com/user/repo.git"
+        
+        config = Configuration(search_path=tmp_path)
+        assert config.get_fast("toolkit.code_host.type") == "gitlab"
+    
+    def test_get_fast_handles_commented_template(
+        self,
+        tmp_path: Path,
+        mock_run: MockRun
+    ):
+        """Test a head full of indented comments is scanned in linear time."""
+        comments = b"".join(b"  # option %d: describe it\n" % i for i in range(200))
+        write_toolkit_yaml(tmp_path, b"toolkit:\n" + comments + b"  custom: 1\n")
+        
+        mock_run.stdout = "https://github.com/user/repo.git"
+        
+        config = Configuration(search_path=tmp_path)
+        assert config.get_fast("toolkit.code_host.type") == "github"
+    
+    @pytest.mark.parametrize(
+        "content",
+        [
+            b"toolkit:\n  code_host:\n    type: github\n  bad: [unclosed\n",
+            b"toolkit:\n  code_host:\n    type: github\n    type: bitbucket\n",
+            b"toolkit:\n  code_host:\n    type: github\ntoolkit:\n  custom: 1\n",
+            b"toolkit:\n  code_host:\n    type: github\n---\ntoolkit: {}\n",
+            b"toolkit:\n  code_host:\n    type: github\n   prefer: api\n",
+        ],
+        ids=[
+            "invalid-later",
+            "duplicate-key",
+            "duplicate-block",
+            "multi-document",
+            "bad-indent",
+        ]
+    )
+    def test_get_fast_agrees_with_get(
+        self,
+        tmp_path: Path,
+        mock_run: MockRun,
+        content: bytes
+    ):
+        """Test get_fast never answers differently from a full load."""
+        write_toolkit_yaml(tmp_path, content)
+        mock_run.stdout = "https://gitlab.com/user/repo.git"
+        
+        fast = Configuration(search_path=tmp_path).get_fast("toolkit.code_host.type")
+        Configuration.clear_cache()
+        loaded = Configuration(search_path=tmp_path).get("toolkit.code_host.type")
+        
+        assert fast == loaded
+    
+    def test_uses_libyaml_loader_when_available(self):
+        """Test config files are parsed with CSafeLoader when PyYAML has it."""
+        expected = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        assert issubclass(config_module._FastLoader, expected)
+    
+    def test_parses_shared_config_file_once(self, tmp_path: Path, monkeypatch):
+        """Test a home config reached from two search paths is parsed once."""
+        home_config = write_toolkit_yaml(
+            tmp_path / "home",
+            b"toolkit:\n  test: value\n"
+        )
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        
+        parsed = []
+        parse = Configuration._parse_config_file
+        
+        def recording_parse(path, mtime_ns):
+            parsed.append(path)
+            return parse(path, mtime_ns)
+        
+        monkeypatch.setattr(Configuration, "_parse_config_file", recording_parse)
+        first = Configuration(search_path=tmp_path / "a")
+        second = Configuration(search_path=tmp_path / "b")
+        
+        assert first.get("toolkit.test") == "value"
+        assert second.get("toolkit.test") == "value"
+        assert parsed == [home_config]
+    
+    def test_shared_config_file_not_mutated_across_search_paths(
+        self,
+        tmp_path: Path,
+        monkeypatch
+    ):
+        """Test configs sharing a loaded file do not see each other's changes."""
+        write_toolkit_yaml(
+            tmp_path / "home",
+            b"toolkit:\n  issue_tracker:\n    project: TEST\n"
+        )
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        
+        first = Configuration(search_path=tmp_path / "a")
+        second = Configuration(search_path=tmp_path / "b")
+        first.get("toolkit.issue_tracker")["project"] = "MUTATED"
+        same_path = Configuration(search_path=tmp_path / "a")
+        
+        assert second.get("toolkit.issue_tracker.project") == "TEST"
+        assert same_path.get("toolkit.issue_tracker.project") == "TEST"
+    
+    def test_relative_search_path_resolved_at_construction(
+        self,
+        tmp_path: Path,
+        monkeypatch
+    ):
+        """Test a cwd change before first access does not change the config."""
+        write_toolkit_yaml(tmp_path / "project", _YAML_BYTES_GITHUB)
+        (tmp_path / "other").mkdir()
+        monkeypatch.chdir(tmp_path)
+        
+        config = Configuration(search_path=Path("project"))
+        monkeypatch.chdir(tmp_path / "other")
+        
+        assert config.config_path == tmp_path / "project" / ".claude" / "toolkit.yaml"
+        assert config.get("toolkit.code_host.type") == "github"
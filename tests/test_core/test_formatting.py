@@ -0,0 +1,74 @@
+"""Tests for output formatting."""
+
+import io
+import re
+import pytest
+from rich.console import Console
+from nexus.core.formatting import OutputFormatter
+
+
+@pytest.fixture
+def formatter() -> OutputFormatter:
+    """Create a formatter that records output instead of printing it.
+    
+    Returns:
+        OutputFormatter with a recording console.
+    """
+    formatter = OutputFormatter()
+    formatter.console = Console(record=True, width=80, file=io.StringIO())
+    return formatter
+
+
+def _table_rows(formatter: OutputFormatter) -> list:
+    """Return the cell values of each printed table row.
+    
+    Args:
+        formatter: Formatter with a recording console.
+        
+    Returns:
+        List of rows, each a list of stripped cell strings.
+    """
+    text = formatter.console.export_text()
+    return [
+        [cell.strip() for cell in re.split("[│┃]", line.strip("│┃"))]
+        for line in text.splitlines()
+        if line[:1] in ("│", "┃")
+    ]
+
+
+class TestOutputFormatter:
+    """Test OutputFormatter class."""
+    
+    def test_format_table_single_column(self, formatter: OutputFormatter):
+        """Test a single selected column prints whole values, not characters."""
+        formatter.format_table(
+            [{"id": "TEST-1", "title": "First"}, {"id": "TEST-22", "title": "Second"}],
+            columns=["id"]
+        )
+        
+        assert _table_rows(formatter) == [["id"], ["TEST-1"], ["TEST-22"]]
+    
+    def test_format_table_missing_column(self, formatter: OutputFormatter):
+        """Test rows without a column get an empty cell."""
+        formatter.format_table(
+            [{"id": 1, "title": "First"}, {"id": 2}],
+            columns=["id", "title"]
+        )
+        
+        assert _table_rows(formatter) == [
+            ["id", "title"],
+            ["1", "First"],
+            ["2", ""],
+        ]
+    
+    def test_format_table_none_value(self, formatter: OutputFormatter):
+        """Test None values are printed as empty cells."""
+        formatter.format_table([{"id": 1, "assignee": None}])
+        
+        assert _table_rows(formatter) == [["id", "assignee"], ["1", ""]]
+    
+    def test_format_table_without_columns(self, formatter: OutputFormatter):
+        """Test rows without any keys print an empty table instead of failing."""
+        formatter.format_table([{}, {}])
+        
+        assert _table_rows(formatter) == []
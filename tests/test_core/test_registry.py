@@ -1,7 +1,12 @@
 """Tests for implementation registry."""
 
 import pytest
-from nexus.core.registry import ImplementationRegistry, Implementation
+from nexus.core.registry import (
+    ImplementationRegistry,
+    Implementation,
+    get_default_registry,
+    reset_default_registry,
+)
 from nexus.core.capabilities import Capability
 from nexus.core.interfaces import CodeHost, IssueTracker
 
@@ -14,9 +19,11 @@ class MockImplementation:
 class TestImplementationRegistry:
     """Test ImplementationRegistry class."""
     
-    def test_register_implementation(self, empty_registry: ImplementationRegistry):
+    def test_register_implementation(self):
         """Test registering an implementation."""
-        empty_registry.register(
+        registry = ImplementationRegistry()
+        
+        registry.register(
             CodeHost,
             MockImplementation,
             [Capability.BASIC_READ],
@@ -24,15 +31,32 @@ class TestImplementationRegistry:
             name="mock"
         )
         
-        implementations = empty_registry.get_implementations(CodeHost)
+        implementations = registry.get_implementations(CodeHost)
         assert len(implementations) == 1
         assert implementations[0].name == "mock"
         assert implementations[0].priority == 1
         assert Capability.BASIC_READ in implementations[0].capabilities
     
-    def test_get_implementations_sorted_by_priority(self, empty_registry: ImplementationRegistry):
+    def test_capabilities_stored_as_tuple(self):
+        """Test capabilities are kept as an ordered, de-duplicated tuple."""
+        registry = ImplementationRegistry()
+        
+        registry.register(
+            CodeHost,
+            MockImplementation,
+            [Capability.API_ACCESS, Capability.BASIC_READ, Capability.API_ACCESS],
+            name="mock"
+        )
+        
+        impl = registry.get_implementation_by_name(CodeHost, "mock")
+        
+        assert impl.capabilities == (Capability.API_ACCESS, Capability.BASIC_READ)
+    
+    def test_get_implementations_sorted_by_priority(self):
         """Test implementations are sorted by priority."""
-        empty_registry.register(
+        registry = ImplementationRegistry()
+        
+        registry.register(
             CodeHost,
             MockImplementation,
             [Capability.BASIC_READ],
@@ -40,7 +64,7 @@ class TestImplementationRegistry:
             name="low"
         )
         
-        empty_registry.register(
+        registry.register(
             CodeHost,
             MockImplementation,
             [Capability.BASIC_READ],
@@ -48,7 +72,7 @@ class TestImplementationRegistry:
             name="high"
         )
         
-        empty_registry.register(
+        registry.register(
             CodeHost,
             MockImplementation,
             [Capability.BASIC_READ],
@@ -56,13 +80,79 @@ class TestImplementationRegistry:
             name="medium"
         )
         
-        implementations = empty_registry.get_implementations(CodeHost)
+        implementations = registry.get_implementations(CodeHost)
         
         assert len(implementations) == 3
         assert implementations[0].name == "high"
         assert implementations[1].name == "medium"
         assert implementations[2].name == "low"
     
+    def test_register_many_matches_sequential_registration(self):
+        """Test bulk registration orders implementations like register()."""
+        registry = ImplementationRegistry()
+        
+        registry.register(
+            CodeHost,
+            MockImplementation,
+            [Capability.BASIC_READ],
+            priority=2,
+            name="existing"
+        )
+        
+        registry.register_many([
+            (CodeHost, MockImplementation, [Capability.BASIC_READ], 1, "low"),
+            (CodeHost, MockImplementation, [Capability.BASIC_READ], 3, "high"),
+            (CodeHost, MockImplementation, [Capability.BASIC_READ], 2, "medium"),
+            (IssueTracker, MockImplementation, [Capability.WEBHOOKS]),
+        ])
+        
+        names = [impl.name for impl in registry.get_implementations(CodeHost)]
+        assert names == ["high", "existing", "medium", "low"]
+        
+        capable = registry.get_implementations_with_capabilities(
+            CodeHost,
+            [Capability.BASIC_READ]
+        )
+        assert [impl.name for impl in capable] == names
+        
+        tracker = registry.get_implementation_by_name(
+            IssueTracker,
+            "MockImplementation"
+        )
+        assert tracker is not None
+        assert tracker.priority == 0
+    
+    def test_register_many_invalid_entry_leaves_registry_unchanged(self):
+        """Test a failing bulk registration does not leave partial entries."""
+        registry = ImplementationRegistry()
+        caps = [Capability.BASIC_READ]
+        registry.register(CodeHost, MockImplementation, caps, priority=5, name="p5")
+        
+        with pytest.raises(ValueError):
+            registry.register_many([
+                (CodeHost, MockImplementation, caps, 1, "p1"),
+                (CodeHost, MockImplementation, caps, 9, "p9"),
+                (CodeHost,),
+            ])
+        registry.register(CodeHost, MockImplementation, caps, priority=3, name="p3")
+        
+        names = [impl.name for impl in registry.get_implementations(CodeHost)]
+        assert names == ["p5", "p3"]
+        assert registry.get_implementation_by_name(CodeHost, "p9") is None
+    
+    def test_get_implementations_returns_copy(self):
+        """Test changing the returned list does not affect the registry."""
+        registry = ImplementationRegistry()
+        caps = [Capability.BASIC_READ]
+        registry.register(CodeHost, MockImplementation, caps, priority=5, name="p5")
+        registry.register(CodeHost, MockImplementation, caps, priority=1, name="p1")
+        
+        registry.get_implementations(CodeHost).pop(0)
+        registry.register(CodeHost, MockImplementation, caps, priority=3, name="p3")
+        
+        names = [impl.name for impl in registry.get_implementations(CodeHost)]
+        assert names == ["p5", "p3", "p1"]
+    
     def test_get_implementation_by_name(self, populated_registry: ImplementationRegistry):
         """Test getting specific implementation by name."""
         impl = populated_registry.get_implementation_by_name(CodeHost, "gitlab-api")
@@ -97,6 +187,19 @@ class TestImplementationRegistry:
         assert len(impls) == 1
         assert impls[0].name == "gitlab-api"
     
+    def test_get_implementations_with_combined_capability_flags(
+        self,
+        populated_registry: ImplementationRegistry
+    ):
+        """Test required capabilities may be passed as combined flags."""
+        impls = populated_registry.get_implementations_with_capabilities(
+            CodeHost,
+            [Capability.BASIC_READ | Capability.API_ACCESS]
+        )
+        
+        assert [impl.name for impl in impls] == ["gitlab-api"]
+        assert Capability.API_ACCESS in impls[0].cap_mask
+    
     def test_no_implementations_with_capabilities(self, populated_registry: ImplementationRegistry):
         """Test when no implementation has required capabilities."""
         impls = populated_registry.get_implementations_with_capabilities(
@@ -106,6 +209,71 @@ class TestImplementationRegistry:
         
         assert len(impls) == 0
     
+    def test_capability_filter_keeps_priority_order(self):
+        """Test capability filtering returns matches highest priority first."""
+        registry = ImplementationRegistry()
+        
+        registry.register(
+            CodeHost,
+            MockImplementation,
+            [Capability.BASIC_READ, Capability.WEBHOOKS],
+            priority=1,
+            name="low"
+        )
+        registry.register(
+            CodeHost,
+            MockImplementation,
+            [Capability.BASIC_READ],
+            priority=5,
+            name="read-only"
+        )
+        registry.register(
+            CodeHost,
+            MockImplementation,
+            [Capability.WEBHOOKS, Capability.BASIC_READ],
+            priority=3,
+            name="high"
+        )
+        
+        impls = registry.get_implementations_with_capabilities(
+            CodeHost,
+            [Capability.BASIC_READ, Capability.WEBHOOKS]
+        )
+        
+        assert [impl.name for impl in impls] == ["high", "low"]
+    
+    def test_capability_filter_sees_new_registrations(
+        self,
+        populated_registry: ImplementationRegistry
+    ):
+        """Test memoized capability queries are refreshed by register and clear."""
+        required = [Capability.API_ACCESS]
+        first = populated_registry.get_implementations_with_capabilities(
+            CodeHost,
+            required
+        )
+        first.clear()
+        
+        populated_registry.register(
+            CodeHost,
+            MockImplementation,
+            [Capability.API_ACCESS],
+            priority=5,
+            name="api-first"
+        )
+        impls = populated_registry.get_implementations_with_capabilities(
+            CodeHost,
+            required
+        )
+        
+        assert [impl.name for impl in impls] == ["api-first", "gitlab-api"]
+        
+        populated_registry.clear()
+        assert populated_registry.get_implementations_with_capabilities(
+            CodeHost,
+            required
+        ) == []
+    
     def test_list_interfaces(self, populated_registry: ImplementationRegistry):
         """Test listing all registered interfaces."""
         interfaces = populated_registry.list_interfaces()
@@ -113,9 +281,50 @@ class TestImplementationRegistry:
         assert CodeHost in interfaces
         assert IssueTracker in interfaces
     
+    def test_copy_is_independent(self, populated_registry: ImplementationRegistry):
+        """Test changes to a copied registry do not leak into the original."""
+        clone = populated_registry.copy()
+        clone.register(
+            CodeHost,
+            MockImplementation,
+            [Capability.WEBHOOKS],
+            priority=5,
+            name="hooks"
+        )
+        clone.clear()
+        
+        assert clone.list_interfaces() == []
+        assert len(populated_registry.get_implementations(CodeHost)) == 2
+        assert populated_registry.get_implementation_by_name(CodeHost, "hooks") is None
+        assert populated_registry.get_implementations_with_capabilities(
+            CodeHost,
+            [Capability.WEBHOOKS]
+        ) == []
+    
+    def test_implementation_records_are_frozen(
+        self,
+        populated_registry: ImplementationRegistry
+    ):
+        """Test shared Implementation records cannot be modified in place."""
+        impl = populated_registry.get_implementation_by_name(CodeHost, "gitlab-api")
+        
+        with pytest.raises(AttributeError):
+            impl.priority = 99
+    
     def test_clear_registry(self, populated_registry: ImplementationRegistry):
         """Test clearing all registrations."""
         populated_registry.clear()
         
         assert len(populated_registry.list_interfaces()) == 0
-        assert len(populated_registry.get_implementations(CodeHost)) == 0
\ No newline at end of file
+        assert len(populated_registry.get_implementations(CodeHost)) == 0
+    
+    def test_default_registry_is_shared(self):
+        """Test the default registry is created once and can be reset."""
+        reset_default_registry()
+        registry = get_default_registry()
+        
+        assert get_default_registry() is registry
+        
+        reset_default_registry()
+        assert get_default_registry() is not registry
+        reset_default_registry()
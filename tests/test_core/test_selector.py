@@ -11,22 +11,18 @@ from nexus.core.exceptions import NoImplementationError, NoCapableImplementation
 class TestToolSelector:
     """Test ToolSelector class."""
     
-    def test_get_tool_with_highest_priority(self, populated_registry: ImplementationRegistry):
+    def test_get_tool_with_highest_priority(self, tool_selector: ToolSelector):
         """Test selector chooses highest priority implementation."""
-        selector = ToolSelector(populated_registry)
-        
         # Should get gitlab-api (priority 2) over gitlab-cli (priority 1)
-        tool = selector.get_tool(CodeHost)
+        tool = tool_selector.get_tool(CodeHost)
         
         assert tool is not None
         assert Capability.API_ACCESS in tool.capabilities
     
-    def test_get_tool_by_capability(self, populated_registry: ImplementationRegistry):
+    def test_get_tool_by_capability(self, tool_selector: ToolSelector):
         """Test selector chooses implementation by capability."""
-        selector = ToolSelector(populated_registry)
-        
         # Request advanced search capability
-        tool = selector.get_tool(
+        tool = tool_selector.get_tool(
             CodeHost,
             required_capabilities=[Capability.ADVANCED_SEARCH]
         )
@@ -34,11 +30,9 @@ class TestToolSelector:
         assert tool is not None
         assert Capability.ADVANCED_SEARCH in tool.capabilities
     
-    def test_get_tool_by_name(self, populated_registry: ImplementationRegistry):
+    def test_get_tool_by_name(self, tool_selector: ToolSelector):
         """Test selector gets specific implementation by name."""
-        selector = ToolSelector(populated_registry)
-        
-        tool = selector.get_tool(
+        tool = tool_selector.get_tool(
             CodeHost,
             preferred_name="gitlab-cli"
         )
@@ -47,11 +41,9 @@ class TestToolSelector:
         assert Capability.CLI_AVAILABLE in tool.capabilities
         assert Capability.API_ACCESS not in tool.capabilities
     
-    def test_fallback_when_preferred_not_found(self, populated_registry: ImplementationRegistry):
+    def test_fallback_when_preferred_not_found(self, tool_selector: ToolSelector):
         """Test selector falls back when preferred implementation not found."""
-        selector = ToolSelector(populated_registry)
-        
-        tool = selector.get_tool(
+        tool = tool_selector.get_tool(
             CodeHost,
             preferred_name="nonexistent"
         )
@@ -60,33 +52,29 @@ class TestToolSelector:
         assert tool is not None
         assert Capability.API_ACCESS in tool.capabilities
     
-    def test_no_implementation_error(self, empty_registry: ImplementationRegistry):
+    def test_no_implementation_error(self):
         """Test error when no implementations registered."""
-        selector = ToolSelector(empty_registry)
+        selector = ToolSelector(ImplementationRegistry())
         
         with pytest.raises(NoImplementationError) as exc_info:
             selector.get_tool(CodeHost)
         
         assert "No implementations registered" in str(exc_info.value)
     
-    def test_no_capable_implementation_error(self, populated_registry: ImplementationRegistry):
+    def test_no_capable_implementation_error(self, tool_selector: ToolSelector):
         """Test error when no implementation has required capabilities."""
-        selector = ToolSelector(populated_registry)
-        
         with pytest.raises(NoCapableImplementationError) as exc_info:
-            selector.get_tool(
+            tool_selector.get_tool(
                 CodeHost,
                 required_capabilities=[Capability.WEBHOOKS]
             )
         
         assert "No implementation has required capabilities" in str(exc_info.value)
     
-    def test_preferred_without_capabilities_error(self, populated_registry: ImplementationRegistry):
+    def test_preferred_without_capabilities_error(self, tool_selector: ToolSelector):
         """Test error when preferred implementation lacks capabilities."""
-        selector = ToolSelector(populated_registry)
-        
         with pytest.raises(NoCapableImplementationError) as exc_info:
-            selector.get_tool(
+            tool_selector.get_tool(
                 CodeHost,
                 required_capabilities=[Capability.ADVANCED_SEARCH],
                 preferred_name="gitlab-cli"
@@ -95,30 +83,39 @@ class TestToolSelector:
         assert "gitlab-cli" in str(exc_info.value)
         assert "does not have required capabilities" in str(exc_info.value)
     
-    def test_list_available_tools(self, populated_registry: ImplementationRegistry):
+    def test_list_available_tools(self, tool_selector: ToolSelector):
         """Test listing available tool implementations."""
-        selector = ToolSelector(populated_registry)
-        
-        tools = selector.list_available_tools(CodeHost)
+        tools = tool_selector.list_available_tools(CodeHost)
         
         assert "gitlab-cli" in tools
         assert "gitlab-api" in tools
         assert len(tools) == 2
     
-    def test_get_tool_capabilities(self, populated_registry: ImplementationRegistry):
-        """Test getting capabilities of specific tool."""
-        selector = ToolSelector(populated_registry)
-        
-        capabilities = selector.get_tool_capabilities(CodeHost, "gitlab-api")
-        
-        assert Capability.BASIC_READ in capabilities
-        assert Capability.ADVANCED_SEARCH in capabilities
-        assert Capability.API_ACCESS in capabilities
-    
-    def test_get_tool_capabilities_not_found(self, populated_registry: ImplementationRegistry):
-        """Test getting capabilities of non-existent tool."""
-        selector = ToolSelector(populated_registry)
-        
-        capabilities = selector.get_tool_capabilities(CodeHost, "nonexistent")
-        
-        assert capabilities == []
\ No newline at end of file
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            (
+                "gitlab-api",
+                {
+                    Capability.BASIC_READ,
+                    Capability.BASIC_WRITE,
+                    Capability.ADVANCED_SEARCH,
+                    Capability.API_ACCESS
+                }
+            ),
+            ("gitlab-cli", {Capability.BASIC_READ, Capability.CLI_AVAILABLE}),
+            ("nonexistent", set()),
+        ],
+        ids=["gitlab-api", "gitlab-cli", "not-found"]
+    )
+    def test_get_tool_capabilities(
+        self,
+        tool_selector: ToolSelector,
+        name: str,
+        expected: set
+    ):
+        """Test getting capabilities of a specific tool."""
+        capabilities = tool_selector.get_tool_capabilities(CodeHost, name)
+        
+        assert isinstance(capabilities, list)
+        assert set(capabilities) == expected